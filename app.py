@@ -16,12 +16,16 @@ import bisect
 import customtkinter as ctk
 import tkinter as tk
 import threading
+import multiprocessing
 import struct
 import time
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import IntEnum
+from functools import reduce
+from operator import attrgetter, itemgetter, xor
 from pathlib import Path
 from tkinter import filedialog, messagebox
 
@@ -37,6 +41,8 @@ import serial.tools.list_ports
 MIDI_NOTE_LOW  = 21
 MIDI_NOTE_HIGH = 108
 NUM_KEYS = 74
+# Channels the parser can emit (one per MIDI note in LOW..HIGH).
+NUM_CHANNELS = MIDI_NOTE_HIGH - MIDI_NOTE_LOW + 1
 
 PACKET_HEADER   = 0xAA
 PACKET_FOOTER   = 0x55
@@ -49,6 +55,11 @@ CMD_ACK         = 0x10
 
 BATCH_SIZE = 64
 
+# On-wire layout of one event (little-endian, no byte-order prefix so it can
+# be repeated inside a batch format): timestamp_us, channel, type, velocity,
+# pad. Must match StoredEvent in the firmware.
+_EVENT_FMT = "IBBBx"
+
 RING_CAPACITY = 1024
 PRIME_BATCHES = 2
 
@@ -57,10 +68,21 @@ DUPLICATE_ON_US     = 210_000
 MIN_GAP_US          = 15_000
 CHORD_WINDOW_US     = 1_000
 
+MIDI_EXTENSIONS = frozenset((".mid", ".midi"))
+MIDI_READ_BUFFER_BYTES = 1 << 20
+# Scans with at least this many files to parse use the process pool. The
+# pool is long-lived, so only the first large scan pays worker start-up.
+FOLDER_PARALLEL_MIN_FILES = 4
+
 INTER_BATCH_DELAY_S = 0.005
 POST_OPEN_SETTLE_S  = 2.0
+TEST_NOTE_SETTLE_S  = 0.5
 ACK_TIMEOUT_S       = 2.0
 BACKPRESSURE_POLL_S = 0.010
+SERIAL_IDLE_CLOSE_S = 30.0
+
+SERIAL_BUSY_MSG = ("The serial port is still in use by another upload or "
+                   "test note — wait for it to finish.")
 
 NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F',
               'F#', 'G', 'G#', 'A', 'A#', 'B']
@@ -109,6 +131,11 @@ VIS_MARQUEE_PX_PER_SEC   = 60     # scroll speed
 VIS_MARQUEE_TAIL_PX      = 80     # gap between filename copies in loop
 
 
+# C-level sort/bisect keys, used instead of lambdas on the hot paths.
+_BY_TIMESTAMP = attrgetter("timestamp_us")
+_BY_START     = itemgetter(0)
+
+
 class EventType(IntEnum):
     NOTE_ON  = 1
     NOTE_OFF = 0
@@ -118,15 +145,17 @@ class EventType(IntEnum):
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SolenoidEvent:
+    # slots=True: songs hold tens of thousands of these, so drop the
+    # per-instance __dict__ for smaller objects and faster field reads.
     timestamp_us: int
     channel: int
     event_type: EventType
     velocity: int
 
     def pack(self) -> bytes:
-        return struct.pack('<IBBBx',
+        return struct.pack('<' + _EVENT_FMT,
                            self.timestamp_us,
                            self.channel,
                            int(self.event_type),
@@ -134,15 +163,15 @@ class SolenoidEvent:
 
     @staticmethod
     def packed_size() -> int:
-        return 8
+        return struct.calcsize('<' + _EVENT_FMT)
 
-    def format_row(self) -> tuple[str, str, str, str, str]:
-        t_sec  = f"{self.timestamp_us / 1_000_000:.4f}s"
-        ch     = str(self.channel)
+    def format_line(self) -> str:
+        """One fixed-width row for the event list, built in a single pass."""
         note   = midi_note_to_name(self.channel + MIDI_NOTE_LOW)
         etype  = "ON" if self.event_type == EventType.NOTE_ON else "OFF"
-        vel    = str(self.velocity)
-        return (t_sec, ch, note, etype, vel)
+        return (f" {self.timestamp_us / 1_000_000:>9.4f}s   "
+                f"{self.channel:>3d}    {note:<5s}  "
+                f"{etype:<4s}    {self.velocity:>3d}")
 
 
 @dataclass
@@ -154,6 +183,10 @@ class SongData:
     # Pre-paired (start_us, end_us, channel) triples for the visualizer.
     # Computed once after the timing-cleanup pipeline runs.
     note_segments: list[tuple[int, int, int]] = field(default_factory=list)
+    # Lowest/highest channel used, tracked during the parse scan so the UI
+    # doesn't need its own pass over every event. -1 when there are none.
+    low_channel: int = -1
+    high_channel: int = -1
 
     @property
     def num_events(self) -> int:
@@ -163,23 +196,49 @@ class SongData:
     def duration_sec(self) -> float:
         return self.duration_us / 1_000_000
 
+    def key_range(self, sep: str = "-") -> str:
+        if self.low_channel < 0:
+            return "--"
+        low  = midi_note_to_name(self.low_channel + MIDI_NOTE_LOW)
+        high = midi_note_to_name(self.high_channel + MIDI_NOTE_LOW)
+        return f"{low} {sep} {high}"
+
 
 # ---------------------------------------------------------------------------
 # MIDI helpers
 # ---------------------------------------------------------------------------
 
-def midi_note_to_name(note: int) -> str:
+def _format_note_name(note: int) -> str:
     octave = (note // 12) - 1
     name   = NOTE_NAMES[note % 12]
     return f"{name}{octave}"
 
 
+# Names for every MIDI note, built once; the event list asks for thousands.
+_NOTE_NAME_BY_MIDI: tuple[str, ...] = tuple(
+    _format_note_name(n) for n in range(128)
+)
+
+
+def midi_note_to_name(note: int) -> str:
+    if 0 <= note < 128:
+        return _NOTE_NAME_BY_MIDI[note]
+    return _format_note_name(note)
+
+
 def midi_note_to_channel(note: int) -> int | None:
     if MIDI_NOTE_LOW <= note <= MIDI_NOTE_HIGH:
         return note - MIDI_NOTE_LOW
     return None
 
 
+# note -> channel (or None) for every MIDI note number, so the parser's hot
+# loop does a tuple index instead of a function call per message.
+_CHANNEL_FOR_NOTE: tuple[int | None, ...] = tuple(
+    midi_note_to_channel(n) for n in range(128)
+)
+
+
 def parse_composer_from_filename(filepath: Path) -> str:
     stem = filepath.stem
     if "-" not in stem:
@@ -214,33 +273,38 @@ def build_note_segments(events: list[SolenoidEvent]
     Returns list of (start_us, end_us, channel) triples.
     Unmatched ONs are extended to start_us + 200ms as a sane default.
     """
-    open_notes: dict[int, int] = {}   # channel -> on_time
+    # channel -> on_time, or -1 when no note is open. Channels are a small
+    # dense range, so a pre-sized list beats a dict that grows and rehashes.
+    open_notes: list[int] = [-1] * NUM_CHANNELS
     segments: list[tuple[int, int, int]] = []
 
     for ev in events:
+        ch = ev.channel
         if ev.event_type == EventType.NOTE_ON:
             # If we somehow have an unmatched ON already, close it at this
             # new ON (synthesia-style — repeat means previous segment ends).
-            prev = open_notes.get(ev.channel)
-            if prev is not None:
-                segments.append((prev, ev.timestamp_us, ev.channel))
-            open_notes[ev.channel] = ev.timestamp_us
+            prev = open_notes[ch]
+            if prev >= 0:
+                segments.append((prev, ev.timestamp_us, ch))
+            open_notes[ch] = ev.timestamp_us
         else:
-            start = open_notes.pop(ev.channel, None)
-            if start is not None:
+            start = open_notes[ch]
+            if start >= 0:
+                open_notes[ch] = -1
                 end = max(ev.timestamp_us, start + 30_000)  # min 30ms
-                segments.append((start, end, ev.channel))
+                segments.append((start, end, ch))
 
     # Any unmatched ONs left over
-    for ch, start in open_notes.items():
-        segments.append((start, start + 200_000, ch))
+    for ch, start in enumerate(open_notes):
+        if start >= 0:
+            segments.append((start, start + 200_000, ch))
 
-    segments.sort(key=lambda s: s[0])
+    segments.sort(key=_BY_START)
     return segments
 
 
 # ---------------------------------------------------------------------------
-# Timing / event-cleanup pipeline (unchanged)
+# Timing / event-cleanup pipeline
 # ---------------------------------------------------------------------------
 
 def merge_fast_restrikes(
@@ -288,7 +352,7 @@ def merge_fast_restrikes(
         if not remove_off:
             merged.append(ev)
 
-    merged.sort(key=lambda e: e.timestamp_us)
+    merged.sort(key=_BY_TIMESTAMP)
 
     final: list[SolenoidEvent] = []
     last_on_time_by_channel: dict[int, int] = {}
@@ -393,11 +457,15 @@ def enforce_min_gap_per_channel(events: list[SolenoidEvent],
             if ev.event_type == EventType.NOTE_ON:
                 last_on_per_channel[ev.channel] = earliest
 
-    adjusted.sort(key=lambda x: x[0])
+    adjusted.sort(key=_BY_START)
 
     result: list[SolenoidEvent] = []
     for t, g in adjusted:
         for ev in g:
+            # Most events keep their time; reuse them instead of copying.
+            if ev.timestamp_us == t:
+                result.append(ev)
+                continue
             result.append(SolenoidEvent(
                 timestamp_us=t,
                 channel=ev.channel,
@@ -443,6 +511,9 @@ def extend_note_durations(events: list[SolenoidEvent],
             desired_off = min(desired_off, ons[idx] - 1)
 
         new_off = max(ev.timestamp_us, desired_off)
+        if new_off == ev.timestamp_us:
+            result.append(ev)
+            continue
 
         result.append(SolenoidEvent(
             timestamp_us=new_off,
@@ -451,7 +522,7 @@ def extend_note_durations(events: list[SolenoidEvent],
             velocity=ev.velocity,
         ))
 
-    result.sort(key=lambda e: e.timestamp_us)
+    result.sort(key=_BY_TIMESTAMP)
     return result
 
 
@@ -509,7 +580,7 @@ def extend_fast_run_offs(events: list[SolenoidEvent],
             velocity=ev.velocity,
         ))
 
-    result.sort(key=lambda e: e.timestamp_us)
+    result.sort(key=_BY_TIMESTAMP)
     return result
 
 
@@ -539,7 +610,7 @@ def decouple_offs_from_ons(events: list[SolenoidEvent],
                 velocity=ev.velocity,
             ))
 
-    result.sort(key=lambda e: e.timestamp_us)
+    result.sort(key=_BY_TIMESTAMP)
     return result
 
 
@@ -549,48 +620,79 @@ def decouple_offs_from_ons(events: list[SolenoidEvent],
 
 def parse_midi_file(filepath: str | Path) -> SongData:
     filepath = Path(filepath)
-    mid = mido.MidiFile(filepath)
+    # Hand mido one large buffered handle instead of letting it open the
+    # path itself, and clip out-of-range data bytes instead of validating
+    # (and raising on) every message.
+    with open(filepath, "rb", buffering=MIDI_READ_BUFFER_BYTES) as f:
+        mid = mido.MidiFile(file=f, clip=True)
 
     song = SongData(filename=filepath.name)
     tempo          = 500_000
     ticks_per_beat = mid.ticks_per_beat
-    song.tempo_bpm = mido.tempo2bpm(tempo)
     abs_time_us    = 0
-
-    for msg in mido.merge_tracks(mid.tracks):
+    low_ch         = NUM_CHANNELS
+    high_ch        = -1
+
+    # Integer tick -> us conversion. Time is measured from the last tempo
+    # change (seg_start_*) so each message costs one multiply/divide with
+    # no float round-trip and no per-delta truncation drift.
+    abs_ticks       = 0
+    seg_start_ticks = 0
+    seg_start_us    = 0
+
+    # Newer mido caches the merged track on the MidiFile; fall back to an
+    # explicit merge on older versions.
+    merged = getattr(mid, "merged_track", None) or mido.merge_tracks(mid.tracks)
+
+    # Hoist lookups out of the per-message loop.
+    append        = song.events.append
+    channel_for   = _CHANNEL_FOR_NOTE
+    note_on_type  = EventType.NOTE_ON
+    note_off_type = EventType.NOTE_OFF
+
+    for msg in merged:
         if msg.time > 0:
-            delta_us = int(
-                mido.tick2second(msg.time, ticks_per_beat, tempo) * 1_000_000
-            )
-            abs_time_us += delta_us
+            abs_ticks  += msg.time
+            abs_time_us = seg_start_us + (
+                (abs_ticks - seg_start_ticks) * tempo // ticks_per_beat)
+
+        # Read msg.type once and dispatch on the local rather than
+        # re-reading the attribute for every compare.
+        mtype = msg.type
+        if mtype == 'note_on':
+            is_on = msg.velocity > 0
+        elif mtype == 'note_off':
+            is_on = False
+        else:
+            if mtype == 'set_tempo':
+                tempo           = msg.tempo
+                seg_start_ticks = abs_ticks
+                seg_start_us    = abs_time_us
+            continue
 
-        if msg.type == 'set_tempo':
-            tempo          = msg.tempo
-            song.tempo_bpm = mido.tempo2bpm(tempo)
+        ch = channel_for[msg.note]
+        if ch is None:
             continue
+        if ch < low_ch:
+            low_ch = ch
+        if ch > high_ch:
+            high_ch = ch
+
+        if is_on:
+            append(SolenoidEvent(abs_time_us, ch, note_on_type, 127))
+        else:
+            append(SolenoidEvent(abs_time_us, ch, note_off_type, 0))
 
-        if msg.type == 'note_on' and msg.velocity > 0:
-            ch = midi_note_to_channel(msg.note)
-            if ch is not None:
-                song.events.append(SolenoidEvent(
-                    timestamp_us=abs_time_us,
-                    channel=ch,
-                    event_type=EventType.NOTE_ON,
-                    velocity=127,
-                ))
-
-        elif msg.type == 'note_off' or (
-                msg.type == 'note_on' and msg.velocity == 0):
-            ch = midi_note_to_channel(msg.note)
-            if ch is not None:
-                song.events.append(SolenoidEvent(
-                    timestamp_us=abs_time_us,
-                    channel=ch,
-                    event_type=EventType.NOTE_OFF,
-                    velocity=0,
-                ))
-
-    song.events.sort(key=lambda e: e.timestamp_us)
+    # Only the last tempo is reported, so convert it once after the scan.
+    song.tempo_bpm = mido.tempo2bpm(tempo)
+    # The cleanup pipeline below drops/moves events but never empties a
+    # channel entirely, so the scanned key range still holds afterwards.
+    if high_ch >= 0:
+        song.low_channel  = low_ch
+        song.high_channel = high_ch
+
+    # merge_tracks yields messages in tick order, so song.events is already
+    # sorted by timestamp here — no sort pass needed.
 
     song.events = merge_fast_restrikes(song.events, RESTRIKE_WINDOW_US)
     song.events = enforce_min_gap_per_channel(song.events, MIN_GAP_US, CHORD_WINDOW_US)
@@ -605,26 +707,52 @@ def parse_midi_file(filepath: str | Path) -> SongData:
     return song
 
 
+def parse_midi_file_or_none(filepath: str | Path) -> SongData | None:
+    """parse_midi_file, but returns None for files that fail to parse."""
+    try:
+        return parse_midi_file(filepath)
+    except Exception:
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Serial protocol
 # ---------------------------------------------------------------------------
 
 def build_batch_packet(events: list[SolenoidEvent]) -> bytes:
-    payload = struct.pack('<BH', CMD_EVENT_BATCH, len(events))
+    # Pack the header fields and every event with one struct call rather
+    # than concatenating a new bytes object per event. The checksum uses
+    # reduce() instead of an explicit loop; it still visits every byte.
+    fields: list[int] = []
     for ev in events:
-        payload += ev.pack()
-    checksum = 0
-    for b in payload:
-        checksum ^= b
+        fields += (ev.timestamp_us, ev.channel, ev.event_type, ev.velocity)
+    payload = struct.pack(f'<BH{_EVENT_FMT * len(events)}',
+                          CMD_EVENT_BATCH, len(events), *fields)
+    checksum = reduce(xor, payload, 0)
     return bytes([PACKET_HEADER]) + payload + bytes([checksum, PACKET_FOOTER])
 
 
-def build_command_packet(cmd: int) -> bytes:
+def _encode_command_packet(cmd: int) -> bytes:
     payload  = bytes([cmd])
     checksum = cmd
     return bytes([PACKET_HEADER]) + payload + bytes([checksum, PACKET_FOOTER])
 
 
+# Command packets never change, so build them once. PING in particular is
+# re-sent every BACKPRESSURE_POLL_S while the MCU ring is full.
+_COMMAND_PACKETS: dict[int, bytes] = {
+    cmd: _encode_command_packet(cmd)
+    for cmd in (CMD_START, CMD_STOP, CMD_PING, CMD_EOS)
+}
+
+
+def build_command_packet(cmd: int) -> bytes:
+    packet = _COMMAND_PACKETS.get(cmd)
+    if packet is None:
+        packet = _encode_command_packet(cmd)
+    return packet
+
+
 def send_packet(ser: serial.Serial, packet: bytes) -> None:
     ser.write(packet)
     try:
@@ -728,6 +856,12 @@ class VisualizerWindow(ctk.CTkToplevel):
         self._canvas_w = 0
         self._canvas_h = 0
 
+        # Keyboard rectangles persist across frames (tag "keyboard"); only
+        # keys whose active state changed get re-filled each tick. Everything
+        # else (guides, notes, playline) is tagged "frame" and redrawn.
+        self._key_items: dict[int, int] = {}  # midi -> canvas item id
+        self._drawn_active: set[int] = set()
+
         self.canvas.bind("<Configure>", self._on_resize)
 
         # --- Custom titlebar overlay (only visible in fullscreen) ---------
@@ -1270,9 +1404,10 @@ class VisualizerWindow(ctk.CTkToplevel):
     def _render(self):
         if self._layout_dirty:
             self._compute_layout()
+            self._build_keyboard()
 
         c = self.canvas
-        c.delete("all")
+        c.delete("frame")
 
         w = self._canvas_w
         h = self._canvas_h
@@ -1288,7 +1423,8 @@ class VisualizerWindow(ctk.CTkToplevel):
                 if rect:
                     x = rect[0]
                     c.create_line(x, 0, x, kb_top,
-                                  fill=VIS_GUIDELINE, width=1)
+                                  fill=VIS_GUIDELINE, width=1,
+                                  tags=("frame",))
 
         # Falling notes
         playhead_us = self._current_song_us()
@@ -1298,11 +1434,13 @@ class VisualizerWindow(ctk.CTkToplevel):
 
         # Red playhead line at the top of the keyboard
         c.create_line(0, kb_top, w, kb_top,
-                      fill=VIS_PLAYLINE, width=2)
+                      fill=VIS_PLAYLINE, width=2, tags=("frame",))
 
-        # Keyboard (compute active keys from current playhead)
+        # Keyboard (compute active keys from current playhead). It was
+        # created before this frame's items, so raise it back on top.
         active_channels = self._active_channels_at(playhead_us)
-        self._draw_keyboard(active_channels)
+        self._update_keyboard(active_channels)
+        c.tag_raise("keyboard")
 
     def _update_header(self):
         """
@@ -1369,10 +1507,11 @@ class VisualizerWindow(ctk.CTkToplevel):
         # to skip the bulk of past notes cheaply.
         # segments is sorted by start_us, but ends aren't monotonic;
         # we still need to scan from the first plausible start.
-        starts = [s[0] for s in segments]
         # Earliest start we'd care about: a note that started up to
-        # `lookahead` ago could still be on screen if it's long.
-        first_idx = bisect.bisect_left(starts, playhead_us - lookahead_us)
+        # `lookahead` ago could still be on screen if it's long. Bisect on
+        # a key so we don't rebuild a list of starts every frame.
+        first_idx = bisect.bisect_left(segments, playhead_us - lookahead_us,
+                                       key=_BY_START)
         # And we stop once start > playhead + lookahead (note hasn't
         # fallen into view yet).
         last_start = playhead_us + lookahead_us
@@ -1422,36 +1561,48 @@ class VisualizerWindow(ctk.CTkToplevel):
                 fill=VIS_NOTE_GREEN_BODY,
                 outline=VIS_NOTE_GREEN_OUTLINE,
                 width=1,
+                tags=("frame",),
             )
 
-    def _draw_keyboard(self, active_channels: set[int]):
+    def _build_keyboard(self):
+        """Create the 88 key rectangles once per layout, all inactive."""
         c = self.canvas
+        c.delete("keyboard")
+        self._key_items = {}
+        self._drawn_active = set()
+
+        # Pass 1: white keys; pass 2: black keys (created on top)
+        for black in (False, True):
+            for midi in range(VIS_FIRST_MIDI, VIS_LAST_MIDI + 1):
+                if is_black_key(midi) != black:
+                    continue
+                rect = self._key_rects.get(midi)
+                if not rect:
+                    continue
+                x0, y0, x1, y1 = rect
+                fill = VIS_BLACK_KEY if black else VIS_WHITE_KEY
+                self._key_items[midi] = c.create_rectangle(
+                    x0, y0, x1, y1,
+                    fill=fill, outline=VIS_KEY_BORDER, width=1,
+                    tags=("keyboard",),
+                )
 
-        # Pass 1: white keys
-        for midi in range(VIS_FIRST_MIDI, VIS_LAST_MIDI + 1):
-            if is_black_key(midi):
-                continue
-            rect = self._key_rects.get(midi)
-            if not rect:
-                continue
-            x0, y0, x1, y1 = rect
-            ch = midi - MIDI_NOTE_LOW
-            fill = VIS_KEY_ACTIVE if ch in active_channels else VIS_WHITE_KEY
-            c.create_rectangle(x0, y0, x1, y1,
-                               fill=fill, outline=VIS_KEY_BORDER, width=1)
-
-        # Pass 2: black keys (drawn on top)
-        for midi in range(VIS_FIRST_MIDI, VIS_LAST_MIDI + 1):
-            if not is_black_key(midi):
-                continue
-            rect = self._key_rects.get(midi)
-            if not rect:
+    def _update_keyboard(self, active_channels: set[int]):
+        """Re-fill only the keys whose active state changed since last tick."""
+        c = self.canvas
+        for ch in active_channels ^ self._drawn_active:
+            midi = ch + MIDI_NOTE_LOW
+            item = self._key_items.get(midi)
+            if item is None:
                 continue
-            x0, y0, x1, y1 = rect
-            ch = midi - MIDI_NOTE_LOW
-            fill = VIS_KEY_ACTIVE if ch in active_channels else VIS_BLACK_KEY
-            c.create_rectangle(x0, y0, x1, y1,
-                               fill=fill, outline=VIS_KEY_BORDER, width=1)
+            if ch in active_channels:
+                fill = VIS_KEY_ACTIVE
+            elif is_black_key(midi):
+                fill = VIS_BLACK_KEY
+            else:
+                fill = VIS_WHITE_KEY
+            c.itemconfigure(item, fill=fill)
+        self._drawn_active = active_channels
 
 
 # ---------------------------------------------------------------------------
@@ -1471,6 +1622,13 @@ class SolenoidPianoApp(ctk.CTk):
         self.configure(fg_color=WINDOW_BG)
 
         self.song: SongData | None = None
+        # Single Song tab state, kept apart from `self.song` (which a
+        # Folder View upload also sets): the file loaded in that tab, whether
+        # a parse is in flight, and a parse that finished mid-upload and is
+        # waiting to be applied.
+        self.single_song: SongData | None = None
+        self._single_parse_in_flight = False
+        self._pending_single_load: tuple[str, SongData] | None = None
         self.is_transmitting = False
         self.is_scanning_folder = False
         self.folder_view_mode = "grid"
@@ -1483,9 +1641,29 @@ class SolenoidPianoApp(ctk.CTk):
         self.folder_selected_color = "#F4B06A"
         self.folder_sort_field = "Filename"
         self.folder_sort_order = "A-Z"
+        # Process pool for folder scans; see _get_parse_pool().
+        self._parse_pool: ProcessPoolExecutor | None = None
+        self._parse_pool_lock = threading.Lock()
+        # path -> ((mtime_ns, size), parsed song or None if it failed)
+        self._folder_song_cache: dict[
+            Path, tuple[tuple[int, int], SongData | None]] = {}
 
         self._paused_song_us: int | None = None
 
+        # Serial connection shared by the upload and test-note workers.
+        # Opening the port (and waiting for the MCU to settle) is the
+        # slowest part of a short upload, so it stays open between runs
+        # and is only reopened when the port/baud changes or a run fails.
+        # `_serial_busy` marks it as held by a running worker; only one run
+        # may use the port at a time. An idle port is closed after
+        # SERIAL_IDLE_CLOSE_S, on Refresh, or when another port is picked,
+        # so flashing tools and serial monitors can open it in between.
+        self._serial: serial.Serial | None = None
+        self._serial_key: tuple[str, int] | None = None
+        self._serial_busy = False
+        self._serial_lock = threading.Lock()
+        self._serial_idle_timer: threading.Timer | None = None
+
         # --- Playback clock state, exposed for the visualizer ------------
         # Set when the worker sends CMD_START. Used together with
         # playback_time_offset_us to compute the current song-time.
@@ -1509,6 +1687,109 @@ class SolenoidPianoApp(ctk.CTk):
         else:
             self.visualizer.show()
 
+    # -----------------------------------------------------------------------
+    # Serial connection
+    # -----------------------------------------------------------------------
+
+    def _acquire_serial(self, port: str, baud: int, settle_s: float
+                        ) -> tuple[serial.Serial, bool] | None:
+        """
+        Claim the shared connection for one run and return `(ser, pinged)`
+        with `ser` open on `port` at `baud`. Returns None if another run
+        still holds it; every successful call must be paired with
+        `_release_serial()`.
+
+        The connection left open by the previous run is reused when it
+        matches and still answers a PING (a USB replug leaves `is_open`
+        True on a dead handle); `pinged` is then True and the caller can
+        skip its own PING. Otherwise the port is reopened, paying the
+        `settle_s` wait, and `pinged` is False.
+        """
+        with self._serial_lock:
+            if self._serial_busy:
+                return None
+            self._serial_busy = True
+            self._cancel_serial_idle_timer()
+
+        try:
+            ser = self._reuse_serial(port, baud)
+            if ser is not None:
+                return ser, True
+            ser = serial.Serial(port, baud, timeout=ACK_TIMEOUT_S)
+            time.sleep(settle_s)
+            drain_input(ser)
+            self._serial = ser
+            self._serial_key = (port, baud)
+            return ser, False
+        except Exception:
+            self._release_serial(keep_open=False)
+            raise
+
+    def _reuse_serial(self, port: str, baud: int) -> serial.Serial | None:
+        ser = self._serial
+        if ser is None:
+            return None
+        if ser.is_open and self._serial_key == (port, baud):
+            try:
+                drain_input(ser)
+                send_packet(ser, build_command_packet(CMD_PING))
+                if wait_for_ack(ser) is not None:
+                    return ser
+            except (serial.SerialException, OSError):
+                pass
+        self._close_serial()
+        return None
+
+    def _release_serial(self, keep_open: bool):
+        """
+        End a run; close the port unless the run finished cleanly, in which
+        case it is closed later by the idle timer if no run reuses it.
+        """
+        if not keep_open:
+            self._close_serial()
+        with self._serial_lock:
+            self._serial_busy = False
+            if self._serial is not None:
+                timer = threading.Timer(SERIAL_IDLE_CLOSE_S,
+                                        self._close_idle_serial)
+                timer.daemon = True
+                self._serial_idle_timer = timer
+                timer.start()
+
+    def _close_idle_serial(self):
+        """Close the shared connection unless a run currently holds it."""
+        with self._serial_lock:
+            self._cancel_serial_idle_timer()
+            if not self._serial_busy:
+                self._close_serial()
+
+    def _cancel_serial_idle_timer(self):
+        # Caller holds _serial_lock.
+        if self._serial_idle_timer is not None:
+            self._serial_idle_timer.cancel()
+            self._serial_idle_timer = None
+
+    def _serial_in_use(self) -> bool:
+        with self._serial_lock:
+            return self._serial_busy
+
+    def destroy(self):
+        with self._serial_lock:
+            self._cancel_serial_idle_timer()
+        self._close_serial()
+        self._shutdown_parse_pool()
+        super().destroy()
+
+    def _close_serial(self):
+        ser = self._serial
+        self._serial = None
+        self._serial_key = None
+        if ser is not None:
+            try:
+                ser.close()
+            except Exception:
+                pass
+
     # -----------------------------------------------------------------------
     # UI construction
     # -----------------------------------------------------------------------
@@ -1607,7 +1888,8 @@ class SolenoidPianoApp(ctk.CTk):
         self.port_combo = ctk.CTkComboBox(
             serial_inner, width=280, values=["(click refresh)"],
             button_color=ACCENT, button_hover_color=ACCENT_HOVER,
-            state="readonly")
+            state="readonly",
+            command=lambda _port: self._close_idle_serial())
         self.port_combo.pack(side="left", padx=5)
 
         ctk.CTkButton(serial_inner, text="Refresh", width=70,
@@ -1842,6 +2124,7 @@ class SolenoidPianoApp(ctk.CTk):
             button_color=ACCENT,
             button_hover_color=ACCENT_HOVER,
             state="readonly",
+            command=lambda _port: self._close_idle_serial(),
         )
         self.folder_port_combo.pack(side="left", padx=5)
 
@@ -1980,19 +2263,83 @@ class SolenoidPianoApp(ctk.CTk):
         self._request_folder_reparse(folder_path)
 
     def _parse_folder_songs(self, folder_path: Path) -> list[tuple[Path, SongData | None]]:
-        midi_files = sorted(
-            [p for p in folder_path.iterdir() if p.is_file() and p.suffix.lower() in {".mid", ".midi"}],
-            key=lambda p: p.name.lower(),
-        )
+        # scandir entries carry their file type from the directory read, so
+        # this avoids a stat() per entry; the extension check runs first so
+        # non-MIDI entries are rejected on a cheap string test.
+        with os.scandir(folder_path) as it:
+            midi_files = sorted(
+                [Path(e.path) for e in it
+                 if os.path.splitext(e.name)[1].lower() in MIDI_EXTENSIONS
+                 and e.is_file()],
+                key=lambda p: p.name.lower(),
+            )
 
-        songs_with_meta: list[tuple[Path, SongData | None]] = []
-        for midi_file in midi_files:
+        # Sorting, view toggles and tab switches all re-scan the folder, so
+        # reuse earlier parses for files whose size/mtime haven't changed.
+        cache = self._folder_song_cache
+        stamps: dict[Path, tuple[int, int]] = {}
+        to_parse: list[Path] = []
+        for p in midi_files:
+            try:
+                st = p.stat()
+            except OSError:
+                to_parse.append(p)
+                continue
+            stamps[p] = (st.st_mtime_ns, st.st_size)
+            cached = cache.get(p)
+            if cached is None or cached[0] != stamps[p]:
+                to_parse.append(p)
+
+        # Parsing is pure-Python CPU work, so threads wouldn't overlap it;
+        # fan larger batches out across the app's process pool instead.
+        # Fall back to parsing in-line if the pool can't be used.
+        parsed: list[SongData | None] | None = None
+        if len(to_parse) >= FOLDER_PARALLEL_MIN_FILES:
             try:
-                song = parse_midi_file(midi_file)
+                pool = self._get_parse_pool()
+                parsed = list(pool.map(parse_midi_file_or_none, to_parse))
             except Exception:
-                song = None
-            songs_with_meta.append((midi_file, song))
-        return songs_with_meta
+                self._shutdown_parse_pool()
+                parsed = None
+        if parsed is None:
+            parsed = [parse_midi_file_or_none(p) for p in to_parse]
+
+        fresh = dict(zip(to_parse, parsed))
+        for p, song in fresh.items():
+            if p in stamps:
+                cache[p] = (stamps[p], song)
+
+        result = [(p, fresh[p] if p in fresh else cache[p][1])
+                  for p in midi_files]
+
+        # Only keep entries for the folder just scanned, so browsing many
+        # folders doesn't pin every song ever parsed in memory. Built as a
+        # new dict (iterating midi_files, not the cache) so an overlapping
+        # scan on another thread never sees the cache mutate mid-iteration.
+        self._folder_song_cache = {p: cache[p] for p in midi_files if p in cache}
+        return result
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """
+        The folder-scan process pool, created on first use and kept for the
+        life of the app so worker start-up (which re-imports this module)
+        is paid once rather than on every rescan. Workers are spawned, not
+        forked, so they never inherit Tk or the serial/worker threads.
+        """
+        with self._parse_pool_lock:
+            if self._parse_pool is None:
+                self._parse_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._parse_pool
+
+    def _shutdown_parse_pool(self):
+        with self._parse_pool_lock:
+            pool = self._parse_pool
+            self._parse_pool = None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
 
     def _request_folder_reparse(self, folder_path: Path):
         self.current_folder_path = folder_path
@@ -2262,13 +2609,7 @@ class SolenoidPianoApp(ctk.CTk):
                 )
             else:
                 composer_text = parse_composer_from_filename(midi_file)
-                if song.events:
-                    channels = [e.channel for e in song.events]
-                    low = midi_note_to_name(min(channels) + MIDI_NOTE_LOW)
-                    high = midi_note_to_name(max(channels) + MIDI_NOTE_LOW)
-                    key_range_text = f"{low} - {high}"
-                else:
-                    key_range_text = "--"
+                key_range_text = song.key_range()
 
                 meta_text = (
                     f"Composer: {composer_text}\n"
@@ -2333,13 +2674,7 @@ class SolenoidPianoApp(ctk.CTk):
                 key_range_text = "parse failed"
             else:
                 composer_text = parse_composer_from_filename(midi_file)
-                if song.events:
-                    channels = [e.channel for e in song.events]
-                    low = midi_note_to_name(min(channels) + MIDI_NOTE_LOW)
-                    high = midi_note_to_name(max(channels) + MIDI_NOTE_LOW)
-                    key_range_text = f"{low} - {high}"
-                else:
-                    key_range_text = "--"
+                key_range_text = song.key_range()
                 duration_text = f"{song.duration_sec:.2f}s"
                 events_text = f"{song.num_events:,}"
                 tempo_text = f"{song.tempo_bpm:.0f} BPM"
@@ -2368,15 +2703,49 @@ class SolenoidPianoApp(ctk.CTk):
             return
 
         self._set_status(f"Parsing {Path(path).name}...")
-        self.update_idletasks()
+        # Parse off the Tk thread so large files don't freeze the window;
+        # the result is marshalled back with after(), as the folder scan does.
+        self._single_parse_in_flight = True
+        self.browse_btn.configure(state="disabled")
+        self._update_transmit_btn()
+        threading.Thread(
+            target=self._parse_file_worker,
+            args=(path,),
+            daemon=True,
+        ).start()
 
+    def _parse_file_worker(self, path: str):
         try:
-            self.song = parse_midi_file(path)
+            song = parse_midi_file(path)
         except Exception as e:
-            messagebox.showerror("Parse Error", f"Could not parse MIDI file:\n{e}")
-            self._set_status("Error parsing file.")
+            self.after(0, self._on_file_parse_failed, e)
+            return
+        self.after(0, self._on_file_parsed, path, song)
+
+    def _on_file_parse_failed(self, error: Exception):
+        self._single_parse_in_flight = False
+        self.browse_btn.configure(state="normal")
+        self._update_transmit_btn()
+        messagebox.showerror("Parse Error", f"Could not parse MIDI file:\n{error}")
+        self._set_status("Error parsing file.")
+
+    def _on_file_parsed(self, path: str, song: SongData):
+        self._single_parse_in_flight = False
+        self.browse_btn.configure(state="normal")
+        if self.is_transmitting:
+            # A folder-view upload started while we were parsing; don't
+            # swap the song out from under it. Load it once the upload ends.
+            self._pending_single_load = (path, song)
+            self._set_status(
+                f"Parsed {Path(path).name} — loads when the current upload finishes")
             return
 
+        self._load_single_song(path, song)
+
+    def _load_single_song(self, path: str, song: SongData):
+        self._pending_single_load = None
+        self.single_song = song
+        self.song = song
         self._paused_song_us = None
         # Reset playback clock state so visualizer shows song at t=0
         self.playback_start_monotonic = None
@@ -2389,11 +2758,19 @@ class SolenoidPianoApp(ctk.CTk):
         )
         self._update_song_info()
         self._populate_event_list()
-        self.transmit_btn.configure(state="normal")
+        self._update_transmit_btn()
         self._set_status(
             f"Loaded {self.song.num_events} events "
             f"({self.song.duration_sec:.1f}s) — ready to transmit")
 
+    def _update_transmit_btn(self):
+        """Single Song upload is allowed only with a file loaded in that tab,
+        no parse in flight, and no upload running."""
+        ready = (self.single_song is not None
+                 and not self._single_parse_in_flight
+                 and not self.is_transmitting)
+        self.transmit_btn.configure(state="normal" if ready else "disabled")
+
     def _update_song_info(self):
         if not self.song:
             return
@@ -2401,13 +2778,7 @@ class SolenoidPianoApp(ctk.CTk):
         self.info_labels["Duration"].configure(text=f"{self.song.duration_sec:.2f}s")
         self.info_labels["Tempo"].configure(text=f"{self.song.tempo_bpm:.0f} BPM")
 
-        if self.song.events:
-            channels = [e.channel for e in self.song.events]
-            low  = midi_note_to_name(min(channels) + MIDI_NOTE_LOW)
-            high = midi_note_to_name(max(channels) + MIDI_NOTE_LOW)
-            self.info_labels["Key Range"].configure(text=f"{low} — {high}")
-        else:
-            self.info_labels["Key Range"].configure(text="--")
+        self.info_labels["Key Range"].configure(text=self.song.key_range("—"))
 
     def _populate_event_list(self):
         self.event_textbox.configure(state="normal")
@@ -2418,21 +2789,19 @@ class SolenoidPianoApp(ctk.CTk):
             return
 
         max_display = 5000
-        lines = []
-        for i, ev in enumerate(self.song.events):
-            if i >= max_display:
-                lines.append(
-                    f"\n  ... {self.song.num_events - max_display:,} "
-                    f"more events not shown ...")
-                break
-            t, ch, note, etype, vel = ev.format_row()
-            lines.append(f" {t:>10s}   {ch:>3s}    {note:<5s}  "
-                         f"{etype:<4s}    {vel:>3s}")
+        lines = [ev.format_line() for ev in self.song.events[:max_display]]
+        if self.song.num_events > max_display:
+            lines.append(
+                f"\n  ... {self.song.num_events - max_display:,} "
+                f"more events not shown ...")
 
         self.event_textbox.insert("1.0", "\n".join(lines))
         self.event_textbox.configure(state="disabled")
 
     def _refresh_ports(self):
+        # Let go of an idle held port so it is listed as free and other
+        # tools can open it.
+        self._close_idle_serial()
         ports = get_serial_ports()
         if ports:
             if hasattr(self, "port_combo"):
@@ -2450,7 +2819,7 @@ class SolenoidPianoApp(ctk.CTk):
                 self.folder_port_combo.set("No ports found")
 
     def _start_transmit(self):
-        if not self.song or self.song.num_events == 0:
+        if not self.single_song or self.single_song.num_events == 0:
             messagebox.showwarning("No Data", "Load a MIDI file first.")
             return
 
@@ -2461,12 +2830,23 @@ class SolenoidPianoApp(ctk.CTk):
                                    "Click Refresh to scan for devices.")
             return
 
+        if self._serial_in_use():
+            messagebox.showwarning("Serial Port Busy", SERIAL_BUSY_MSG)
+            return
+
         port = extract_port_name(port_str)
         baud = int(self.baud_combo.get())
 
+        if self.song is not self.single_song:
+            # A Folder View upload played a different song since; its pause
+            # point doesn't apply to this one.
+            self.song = self.single_song
+            self._paused_song_us = None
+
         if self._paused_song_us is not None:
-            timestamps = [e.timestamp_us for e in self.song.events]
-            start_index = bisect.bisect_left(timestamps, self._paused_song_us)
+            start_index = bisect.bisect_left(self.song.events,
+                                             self._paused_song_us,
+                                             key=_BY_TIMESTAMP)
             if start_index >= len(self.song.events):
                 start_index = 0
                 time_offset_us = 0
@@ -2510,6 +2890,10 @@ class SolenoidPianoApp(ctk.CTk):
         if self.is_transmitting:
             return
 
+        if self._serial_in_use():
+            messagebox.showwarning("Serial Port Busy", SERIAL_BUSY_MSG)
+            return
+
         port = extract_port_name(port_str)
         baud = int(self.folder_baud_combo.get())
         song = self.selected_folder_song
@@ -2521,6 +2905,7 @@ class SolenoidPianoApp(ctk.CTk):
 
         self.is_transmitting = True
         self.folder_transmit_btn.configure(state="disabled")
+        self._update_transmit_btn()
         self.folder_stop_btn.configure(state="normal")
         self.folder_browse_btn.configure(state="disabled")
         self.folder_progress.set(0)
@@ -2530,6 +2915,9 @@ class SolenoidPianoApp(ctk.CTk):
 
     def _transmit_worker_folder(self, port: str, baud: int, song: SongData):
         ser: serial.Serial | None = None
+        # Leave the port open for the next upload unless something went
+        # wrong, in which case the next run reconnects from scratch.
+        keep_open = False
 
         def current_song_position_us() -> int:
             if self.playback_start_monotonic is None:
@@ -2539,6 +2927,8 @@ class SolenoidPianoApp(ctk.CTk):
             return elapsed_us
 
         def handle_stop():
+            nonlocal keep_open
+            keep_open = True
             pos = current_song_position_us()
             self._paused_song_us = pos
             try:
@@ -2552,16 +2942,19 @@ class SolenoidPianoApp(ctk.CTk):
 
         try:
             self._set_folder_status_safe(f"Connecting to {port}...")
-            ser = serial.Serial(port, baud, timeout=ACK_TIMEOUT_S)
-            time.sleep(POST_OPEN_SETTLE_S)
-            drain_input(ser)
-
-            self._set_folder_status_safe("Pinging MCU...")
-            send_packet(ser, build_command_packet(CMD_PING))
-            free = wait_for_ack(ser)
-            if free is None:
-                self._show_error_safe("Connection Failed", "No response from MCU.")
+            acquired = self._acquire_serial(port, baud, POST_OPEN_SETTLE_S)
+            if acquired is None:
+                self._show_error_safe("Serial Port Busy", SERIAL_BUSY_MSG)
                 return
+            ser, pinged = acquired
+
+            if not pinged:
+                self._set_folder_status_safe("Pinging MCU...")
+                send_packet(ser, build_command_packet(CMD_PING))
+                if wait_for_ack(ser) is None:
+                    self._show_error_safe("Connection Failed",
+                                          "No response from MCU.")
+                    return
 
             send_packet(ser, build_command_packet(CMD_STOP))
             free = wait_for_ack(ser)
@@ -2647,6 +3040,7 @@ class SolenoidPianoApp(ctk.CTk):
 
             self._paused_song_us = None
             self._set_folder_status_safe(f"Finished: {song.filename}")
+            keep_open = True
 
         except serial.SerialException as e:
             self._show_error_safe("Serial Error", str(e))
@@ -2654,15 +3048,15 @@ class SolenoidPianoApp(ctk.CTk):
             self._show_error_safe("Error", str(e))
         finally:
             if ser is not None:
-                try:
-                    ser.close()
-                except Exception:
-                    pass
+                self._release_serial(keep_open)
             self._finish_folder_transmit_safe()
 
     def _transmit_worker(self, port: str, baud: int,
                           start_index: int = 0, time_offset_us: int = 0):
         ser: serial.Serial | None = None
+        # Leave the port open for the next upload unless something went
+        # wrong, in which case the next run reconnects from scratch.
+        keep_open = False
 
         def current_song_position_us() -> int:
             if self.playback_start_monotonic is None:
@@ -2672,6 +3066,8 @@ class SolenoidPianoApp(ctk.CTk):
             return time_offset_us + elapsed_us
 
         def handle_stop():
+            nonlocal keep_open
+            keep_open = True
             pos = current_song_position_us()
             self._paused_song_us = pos
             try:
@@ -2685,21 +3081,23 @@ class SolenoidPianoApp(ctk.CTk):
 
         try:
             self._set_status_safe(f"Connecting to {port}...")
-            ser = serial.Serial(port, baud, timeout=ACK_TIMEOUT_S)
-            time.sleep(POST_OPEN_SETTLE_S)
-            drain_input(ser)
-
-            send_packet(ser, build_command_packet(CMD_PING))
-            free = wait_for_ack(ser)
-            if free is None:
-                self._show_error_safe(
-                    "Connection Failed",
-                    "No response from MCU.\n\n"
-                    "Check that:\n"
-                    "• The USB cable is connected\n"
-                    "• The correct COM port is selected\n"
-                    "• The MCU firmware is running")
+            acquired = self._acquire_serial(port, baud, POST_OPEN_SETTLE_S)
+            if acquired is None:
+                self._show_error_safe("Serial Port Busy", SERIAL_BUSY_MSG)
                 return
+            ser, pinged = acquired
+
+            if not pinged:
+                send_packet(ser, build_command_packet(CMD_PING))
+                if wait_for_ack(ser) is None:
+                    self._show_error_safe(
+                        "Connection Failed",
+                        "No response from MCU.\n\n"
+                        "Check that:\n"
+                        "• The USB cable is connected\n"
+                        "• The correct COM port is selected\n"
+                        "• The MCU firmware is running")
+                    return
 
             send_packet(ser, build_command_packet(CMD_STOP))
             free = wait_for_ack(ser)
@@ -2809,6 +3207,7 @@ class SolenoidPianoApp(ctk.CTk):
 
             self._paused_song_us = None
             self._set_status_safe(f"Finished: {self.song.filename}")
+            keep_open = True
 
         except serial.SerialException as e:
             self._show_error_safe("Serial Error", str(e))
@@ -2816,10 +3215,7 @@ class SolenoidPianoApp(ctk.CTk):
             self._show_error_safe("Error", str(e))
         finally:
             if ser is not None:
-                try:
-                    ser.close()
-                except Exception:
-                    pass
+                self._release_serial(keep_open)
             self._finish_transmit_safe()
 
     def _test_note(self):
@@ -2828,6 +3224,10 @@ class SolenoidPianoApp(ctk.CTk):
                              "stop the song first.")
             return
 
+        if self._serial_in_use():
+            self._set_status(SERIAL_BUSY_MSG)
+            return
+
         note_text = self.note_entry.get().strip()
         if not note_text:
             self._set_status("Enter a note name (e.g. C4, A0, G#5)")
@@ -2878,15 +3278,22 @@ class SolenoidPianoApp(ctk.CTk):
 
     def _test_note_worker(self, port, baud, events, note_name):
         ser: serial.Serial | None = None
+        # Leave the port open for the next upload unless something went
+        # wrong, in which case the next run reconnects from scratch.
+        keep_open = False
         try:
-            ser = serial.Serial(port, baud, timeout=ACK_TIMEOUT_S)
-            time.sleep(0.5)
-            drain_input(ser)
-
-            send_packet(ser, build_command_packet(CMD_PING))
-            if wait_for_ack(ser) is None:
-                self._set_status_safe("No response from MCU — check connection")
+            acquired = self._acquire_serial(port, baud, TEST_NOTE_SETTLE_S)
+            if acquired is None:
+                self._set_status_safe(SERIAL_BUSY_MSG)
                 return
+            ser, pinged = acquired
+
+            if not pinged:
+                send_packet(ser, build_command_packet(CMD_PING))
+                if wait_for_ack(ser) is None:
+                    self._set_status_safe(
+                        "No response from MCU — check connection")
+                    return
 
             send_packet(ser, build_command_packet(CMD_STOP))
             if wait_for_ack(ser) is None:
@@ -2905,6 +3312,7 @@ class SolenoidPianoApp(ctk.CTk):
             wait_for_ack(ser)
 
             self._set_status_safe(f"Played {note_name}")
+            keep_open = True
 
         except serial.SerialException as e:
             self._set_status_safe(f"Serial error: {e}")
@@ -2912,10 +3320,7 @@ class SolenoidPianoApp(ctk.CTk):
             self._set_status_safe(f"Error: {e}")
         finally:
             if ser is not None:
-                try:
-                    ser.close()
-                except Exception:
-                    pass
+                self._release_serial(keep_open)
 
     def _send_stop(self):
         if not self.is_transmitting:
@@ -2965,13 +3370,19 @@ class SolenoidPianoApp(ctk.CTk):
                 self.folder_stop_btn.configure(state="disabled")
             if hasattr(self, "folder_browse_btn"):
                 self.folder_browse_btn.configure(state="normal")
+            # Apply a Single Song parse that finished during the upload.
+            pending = self._pending_single_load
+            if pending is not None:
+                self._load_single_song(*pending)
+            else:
+                self._update_transmit_btn()
         self.after(0, _finish)
 
     def _finish_transmit_safe(self):
         def _finish():
             self.is_transmitting = False
             self.playback_start_monotonic = None
-            self.transmit_btn.configure(state="normal")
+            self._update_transmit_btn()
             self.browse_btn.configure(state="normal")
             self.stop_btn.configure(state="disabled")
         self.after(0, _finish)